@@ -44,6 +44,9 @@ setup(
     package_data={},
     python_requires="~=3.5",
     install_requires=[],
+    extras_require={
+        "test": ["hypothesis"]
+    },
     license="Apache License 2.0",
     classifiers=[
         "Operating System :: OS Independent",
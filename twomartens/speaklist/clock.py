@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+#   Copyright 2018 Jim Martens
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""speaklist.clock: provides the speaking clock"""
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_WINDOW = 10
+
+
+class RingBuffer:
+    """Keeps the most recent values up to a fixed capacity together with their sum."""
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes the ring buffer.
+
+        :param capacity: maximum number of values kept
+        """
+        if capacity < 1:
+            raise ValueError
+        self._values = deque(maxlen=capacity)  # type: deque
+        self._sum = 0.0
+
+    def append(self, value: float) -> None:
+        """
+        Appends a value, evicting the oldest one if the buffer is full.
+
+        :param value: new value
+        """
+        if len(self._values) == self._values.maxlen:
+            self._sum -= self._values[0]
+        self._values.append(value)
+        self._sum += value
+
+    def mean(self) -> float:
+        """Returns the mean of the values currently kept.
+
+        :return: mean or 0.0 if the buffer is empty
+        """
+        if not self._values:
+            return 0.0
+        return self._sum / len(self._values)
+
+    @property
+    def capacity(self) -> int:
+        """:return: maximum number of values kept"""
+        return self._values.maxlen
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+
+class IndexedHeap:
+    """Implements a binary min-heap of keys whose priorities can be updated in place."""
+
+    def __init__(self) -> None:
+        """Initializes the empty heap."""
+        self._heap = []  # type: List[Tuple[float, int, str]]
+        self._positions = {}  # type: Dict[str, int]
+        self._counter = 0
+
+    def push(self, key: str, priority: float) -> None:
+        """
+        Adds a key or updates its priority if it is already present.
+
+        :param key: key
+        :param priority: new priority of the key
+        """
+        if key in self._positions:
+            position = self._positions[key]
+            old_priority, order, _ = self._heap[position]
+            self._heap[position] = (priority, order, key)
+            if priority < old_priority:
+                self._sift_up(position)
+            else:
+                self._sift_down(position)
+            return
+
+        self._heap.append((priority, self._counter, key))
+        self._counter += 1
+        self._positions[key] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self) -> Optional[str]:
+        """Returns the key with the lowest priority without removing it.
+
+        :return: key or None if the heap is empty
+        """
+        if not self._heap:
+            return None
+        return self._heap[0][2]
+
+    def priority(self, key: str) -> float:
+        """
+        Returns the priority of given key.
+
+        :param key: key
+        :return: priority of the key
+        """
+        return self._heap[self._positions[key]][0]
+
+    def _sift_up(self, position: int) -> None:
+        item = self._heap[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if self._heap[parent] <= item:
+                break
+            self._heap[position] = self._heap[parent]
+            self._positions[self._heap[position][2]] = position
+            position = parent
+        self._heap[position] = item
+        self._positions[item[2]] = position
+
+    def _sift_down(self, position: int) -> None:
+        length = len(self._heap)
+        item = self._heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= length:
+                break
+            if child + 1 < length and self._heap[child + 1] < self._heap[child]:
+                child += 1
+            if item <= self._heap[child]:
+                break
+            self._heap[position] = self._heap[child]
+            self._positions[self._heap[position][2]] = position
+            position = child
+        self._heap[position] = item
+        self._positions[item[2]] = position
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+
+
+class SpeakingClock:
+    """Keeps track of the speaking time of every speaker."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW, timer: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes the speaking clock.
+
+        :param window: number of recent speeches considered for rolling averages
+        :param timer: returns the current time in seconds
+        """
+        self._window = window
+        self._timer = timer
+        self._totals = {}  # type: Dict[str, float]
+        self._counts = {}  # type: Dict[str, int]
+        self._recent = {}  # type: Dict[str, RingBuffer]
+        self._speeches = {}  # type: Dict[str, deque]
+        self._overall = RingBuffer(window)
+        self._heap = IndexedHeap()
+        self._speaker = None  # type: Optional[str]
+        self._started = 0.0
+
+    def start(self, speaker: str) -> None:
+        """
+        Starts the clock for given speaker, stopping the current speaker first.
+
+        :param speaker: name of the speaker
+        """
+        self.stop()
+        self._speaker = speaker
+        self._started = self._timer()
+        if speaker not in self._totals:
+            self._totals[speaker] = 0.0
+            self._counts[speaker] = 0
+            self._recent[speaker] = RingBuffer(self._window)
+            self._speeches[speaker] = deque(maxlen=self._window)
+
+    def stop(self) -> float:
+        """Stops the clock for the current speaker.
+
+        :return: duration of the finished speech or 0.0 if nobody was speaking
+        """
+        if self._speaker is None:
+            return 0.0
+        speaker = self._speaker
+        stopped = self._timer()
+        duration = stopped - self._started
+        self._speaker = None
+        self._speeches[speaker].append((self._started, stopped))
+        self._totals[speaker] += duration
+        self._counts[speaker] += 1
+        self._recent[speaker].append(duration)
+        self._overall.append(duration)
+        self._heap.push(speaker, self._totals[speaker])
+        return duration
+
+    def current(self) -> Optional[str]:
+        """Returns the speaker who is currently speaking.
+
+        :return: name of the speaker or None
+        """
+        return self._speaker
+
+    def elapsed(self) -> float:
+        """Returns the time the current speaker has been speaking.
+
+        :return: elapsed time or 0.0 if nobody is speaking
+        """
+        if self._speaker is None:
+            return 0.0
+        return self._timer() - self._started
+
+    def total(self, speaker: str) -> float:
+        """
+        Returns the accumulated speaking time of given speaker (finished speeches only).
+
+        :param speaker: name of the speaker
+        :return: total speaking time, 0.0 for unknown speakers
+        """
+        return self._totals.get(speaker, 0.0)
+
+    def count(self, speaker: str) -> int:
+        """
+        Returns the number of finished speeches of given speaker.
+
+        :param speaker: name of the speaker
+        :return: number of speeches
+        """
+        return self._counts.get(speaker, 0)
+
+    def average(self, speaker: str) -> float:
+        """
+        Returns the average duration of the most recent speeches of given speaker.
+
+        :param speaker: name of the speaker
+        :return: rolling average, 0.0 for unknown speakers
+        """
+        if speaker not in self._recent:
+            return 0.0
+        return self._recent[speaker].mean()
+
+    def speeches(self, speaker: str) -> List[Tuple[float, float]]:
+        """
+        Returns the start and stop times of the most recent speeches of given speaker.
+
+        :param speaker: name of the speaker
+        :return: list of start and stop times, oldest first
+        """
+        if speaker not in self._speeches:
+            return []
+        return list(self._speeches[speaker])
+
+    def overall_average(self) -> float:
+        """Returns the average duration of the most recent speeches of all speakers.
+
+        :return: rolling average
+        """
+        return self._overall.mean()
+
+    def least_speaking(self) -> Optional[str]:
+        """Returns the speaker with the least accumulated speaking time among those who finished a speech.
+
+        :return: name of the speaker or None if nobody has spoken yet
+        """
+        return self._heap.peek()
+
+    def totals(self) -> Dict[str, float]:
+        """Returns the accumulated speaking time of all known speakers.
+
+        :return: mapping from speaker to total speaking time
+        """
+        return dict(self._totals)
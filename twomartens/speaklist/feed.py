@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+#   Copyright 2018 Jim Martens
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""speaklist.feed: provides the change-feed for the queue"""
+import json
+from bisect import bisect_left
+from collections import namedtuple
+from typing import Iterator, List, Optional, TextIO
+
+INSERT = 'insert'
+DELETE = 'delete'
+MOVE = 'move'
+
+Change = namedtuple('Change', ['operation', 'index', 'target', 'speaker'])
+Change.__doc__ = """Describes a single position-level change of the speak list.
+
+insert: speaker is inserted at index
+delete: speaker at index is removed
+move: speaker at index is removed and then inserted at target
+"""
+
+
+def insert_change(index: int, speaker: str) -> Change:
+    """Creates an insert change.
+
+    :param index: position of the new speaker
+    :param speaker: name of the new speaker
+    :return: change
+    """
+    return Change(INSERT, index, None, speaker)
+
+
+def delete_change(index: int) -> Change:
+    """Creates a delete change.
+
+    :param index: position of the removed speaker
+    :return: change
+    """
+    return Change(DELETE, index, None, None)
+
+
+def move_change(index: int, target: int) -> Change:
+    """Creates a move change.
+
+    :param index: position of the speaker before the move
+    :param target: position of the speaker after the move
+    :return: change
+    """
+    return Change(MOVE, index, target, None)
+
+
+def apply_change(speakers: List[str], change: Change) -> None:
+    """Applies a change inplace to the given list of speakers.
+
+    :param speakers: list of speakers
+    :param change: change to apply
+    """
+    if change.operation == INSERT:
+        speakers.insert(change.index, change.speaker)
+    elif change.operation == DELETE:
+        del speakers[change.index]
+    elif change.operation == MOVE:
+        speakers.insert(change.target, speakers.pop(change.index))
+    else:
+        raise ValueError
+
+
+def _longest_increasing_subsequence(sequence: List[int]) -> List[int]:
+    """Returns the values of a longest strictly increasing subsequence.
+
+    :param sequence: sequence of distinct integers
+    :return: increasing subsequence of maximum length
+    """
+    tails = []  # type: List[int]
+    tail_positions = []  # type: List[int]
+    predecessors = []  # type: List[Optional[int]]
+    for position, value in enumerate(sequence):
+        length = bisect_left(tails, value)
+        predecessors.append(tail_positions[length - 1] if length > 0 else None)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+
+    subsequence = []
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        subsequence.append(sequence[position])
+        position = predecessors[position]
+    subsequence.reverse()
+    return subsequence
+
+
+def diff_permutation(order: List[int]) -> List[Change]:
+    """Computes a minimal list of moves that reorders a list according to given permutation.
+
+    Only entries outside of a longest increasing subsequence of the permutation are moved,
+    each of them directly behind its new predecessor.
+
+    :param order: old positions in their new order
+    :return: move changes
+    """
+    stable = set(_longest_increasing_subsequence(order))
+    current = list(range(len(order)))
+    changes = []
+    for new_position, old_position in enumerate(order):
+        if old_position in stable:
+            continue
+        index = current.index(old_position)
+        current.pop(index)
+        target = current.index(order[new_position - 1]) + 1 if new_position > 0 else 0
+        current.insert(target, old_position)
+        if index != target:
+            changes.append(move_change(index, target))
+    return changes
+
+
+class Replica:
+    """Rebuilds the speak list from a change-feed."""
+
+    def __init__(self) -> None:
+        """Initializes the empty replica."""
+        self.speakers = []  # type: List[str]
+
+    def __call__(self, change: Change) -> None:
+        apply_change(self.speakers, change)
+
+
+class FileSink:
+    """Writes a change-feed as JSON lines to a file or pipe."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """
+        Initializes the sink.
+
+        :param stream: writable text stream
+        """
+        self._stream = stream
+
+    def __call__(self, change: Change) -> None:
+        self._stream.write(json.dumps(list(change)) + '\n')
+        self._stream.flush()
+
+
+def read_changes(stream: TextIO) -> Iterator[Change]:
+    """Reads a change-feed written by a FileSink.
+
+    :param stream: readable text stream
+    :return: iterator over the changes
+    """
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield Change(*json.loads(line))
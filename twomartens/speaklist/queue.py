@@ -16,8 +16,12 @@
 
 """speaklist.queue: provides the queue class"""
 from abc import abstractmethod
-from collections import Iterator, MutableSequence, deque, Counter
-from typing import List, Union, Any, Dict
+from collections import deque
+from collections.abc import Iterator, MutableSequence
+from typing import List, Union, Any, Callable, Dict, Optional
+
+from twomartens.speaklist.clock import SpeakingClock
+from twomartens.speaklist.feed import Change, delete_change, diff_permutation, insert_change
 
 
 def sort_data(sorted_indices: List[int], data: List[Any]) -> List[Any]:
@@ -36,15 +40,47 @@ def sort_data(sorted_indices: List[int], data: List[Any]) -> List[Any]:
 class Queue(MutableSequence):
     """Implements a priority queue with multiple priorities considered."""
     
-    def __init__(self, priorities: List['Priority']) -> None:
+    def __init__(self, priorities: List['Priority'], clock: Optional[SpeakingClock] = None) -> None:
         """
         Initializes the priority queue.
         
         :param priorities: list of Priorities to consider
+        :param clock: speaking clock that is started for every speaker returned by next_speaker
         """
         self._speakers = deque()  # type: deque
         self._priorityData = deque()  # type: deque
         self._priorities = priorities
+        self._clock = clock
+        self._subscribers = []  # type: List[Callable[[Change], None]]
+    
+    @property
+    def clock(self) -> Optional[SpeakingClock]:
+        """:return: speaking clock of the queue or None"""
+        return self._clock
+    
+    def subscribe(self, subscriber: Callable[[Change], None]) -> None:
+        """
+        Subscribes to the change-feed of the queue.
+        
+        The subscriber immediately receives the current speakers as insert changes.
+        
+        :param subscriber: called with every change of the queue
+        """
+        for index, speaker in enumerate(self._speakers):
+            subscriber(insert_change(index, speaker))
+        self._subscribers.append(subscriber)
+    
+    def unsubscribe(self, subscriber: Callable[[Change], None]) -> None:
+        """
+        Removes a subscriber from the change-feed of the queue.
+        
+        :param subscriber: previously subscribed callable
+        """
+        self._subscribers.remove(subscriber)
+    
+    def _emit(self, change: Change) -> None:
+        for subscriber in self._subscribers:
+            subscriber(change)
     
     def is_prioritized(self) -> bool:
         """Checks if the queue is properly prioritized.
@@ -53,9 +89,7 @@ class Queue(MutableSequence):
         """
         i = 0
         for priority in self._priorities:
-            priority_data = []
-            for data in self._priorityData:
-                priority_data.append(data[i])
+            priority_data = [data[i] for data in self._priorityData]
             i += 1
             if not priority.is_valid_list(priority_data):
                 return False
@@ -64,20 +98,21 @@ class Queue(MutableSequence):
     
     def prioritize(self) -> None:
         """Inplace prioritization of queue."""
+        # the sorts are composed into a single permutation that is applied once at the end
+        all_data = list(self._priorityData)
+        order = list(range(len(all_data)))
         i = 0
         for priority in self._priorities:
-            priority_data = []
-            for data in self._priorityData:
-                priority_data.append(data[i])
+            priority_data = [all_data[index][i] for index in order]
             i += 1
-            sorted_indices = priority.sort(priority_data)
-            new_priority_data = []
-            new_speakers = []
-            for index in sorted_indices:
-                new_priority_data.append(self._priorityData[index])
-                new_speakers.append(self._speakers[index])
-            self._priorityData = new_priority_data
-            self._speakers = new_speakers
+            order = [order[index] for index in priority.sort(priority_data)]
+        
+        speakers = list(self._speakers)
+        self._speakers = deque(speakers[index] for index in order)
+        self._priorityData = deque(all_data[index] for index in order)
+        if self._subscribers:
+            for change in diff_permutation(order):
+                self._emit(change)
     
     def insert(self, index: int, value: list) -> None:
         """
@@ -87,14 +122,18 @@ class Queue(MutableSequence):
         :param value: list of name and priority data
         """
         priority_data = []
+        current_data = self._get_priority_data()
         i = 1
         for priority in self._priorities:
-            if not priority.is_valid_insert(self._get_priority_data()[priority], value[i]):
+            if not priority.is_valid_insert(current_data[priority], value[i]):
                 raise ValueError
             priority_data.append(value[i])
             i += 1
+        length = len(self._speakers)
+        index = max(0, index + length) if index < 0 else min(index, length)
         self._speakers.insert(index, value[0])
         self._priorityData.insert(index, priority_data)
+        self._emit(insert_change(index, value[0]))
     
     def append(self, value: List[Any]) -> None:
         """
@@ -103,14 +142,16 @@ class Queue(MutableSequence):
         :param value: list of name and priority data
         """
         priority_data = []
+        current_data = self._get_priority_data()
         i = 1
         for priority in self._priorities:
-            if not priority.is_valid_insert(self._get_priority_data()[priority], value[i]):
+            if not priority.is_valid_insert(current_data[priority], value[i]):
                 raise ValueError
             priority_data.append(value[i])
             i += 1
         self._speakers.append(value[0])
         self._priorityData.append(priority_data)
+        self._emit(insert_change(len(self._speakers) - 1, value[0]))
     
     def pop(self, index=0) -> str:
         """
@@ -121,17 +162,26 @@ class Queue(MutableSequence):
         """
         speaker = self._speakers.popleft()
         self._priorityData.popleft()
+        self._emit(delete_change(0))
+        return speaker
+    
+    def next_speaker(self) -> str:
+        """
+        Pops the next speaker from the queue and starts the speaking clock for them.
+        
+        :return: name of the next speaker
+        """
+        speaker = self.pop()
+        if self._clock is not None:
+            self._clock.start(speaker)
         return speaker
     
     def _get_priority_data(self) -> Dict['Priority', List[Any]]:
-        i = 0
         priority_data = {}
+        i = 0
         for priority in self._priorities:
-            __priority_data = []
-            for data in self._priorityData:
-                __priority_data.append(data[i])
+            priority_data[priority] = [data[i] for data in self._priorityData]
             i += 1
-            priority_data[priority] = __priority_data
         return priority_data
     
     def __iter__(self) -> Iterator:
@@ -148,18 +198,23 @@ class Queue(MutableSequence):
     
     def __setitem__(self, key: Union[int, slice], value: list) -> None:
         priority_data = []
+        current_data = self._get_priority_data()
         i = 1
         for priority in self._priorities:
-            if not priority.is_valid_insert(self._get_priority_data()[priority], value[i]):
+            if not priority.is_valid_insert(current_data[priority], value[i]):
                 raise ValueError
-            priority_data += value[i]
+            priority_data.append(value[i])
             i += 1
         self._speakers.__setitem__(key, value[0])
         self._priorityData.__setitem__(key, priority_data)
+        index = key % len(self._speakers)
+        self._emit(delete_change(index))
+        self._emit(insert_change(index, value[0]))
     
     def __delitem__(self, key: Union[int, slice]) -> None:
         self._speakers.__delitem__(key)
         self._priorityData.__delitem__(key)
+        self._emit(delete_change(key % (len(self._speakers) + 1)))
 
 
 class Priority:
@@ -210,19 +265,15 @@ class FirstSpeakerPriority(Priority):
         if length < 3:
             return True
         
-        max_counter = Counter(queue)
-        current_counter = {}
+        # a speaker may only speak again once every speaker on the list has spoken
+        number_of_speakers = len(set(queue))
+        seen = set()
         
         for speaker in queue:
-            if speaker not in current_counter:
-                current_counter[speaker] = 1
-            else:
-                for potential_speaker in max_counter:
-                    if potential_speaker == speaker:
-                        continue
-                    if potential_speaker not in current_counter:
-                        return False
-                current_counter[speaker] += 1
+            if speaker not in seen:
+                seen.add(speaker)
+            elif len(seen) < number_of_speakers:
+                return False
         
         return True
 
@@ -260,21 +311,19 @@ class FITSoftPriority(Priority):
         return counter == 0
 
     def sort(self, queue: List[bool]) -> List[int]:
-        indices = []
+        if self.is_valid_list(queue):
+            return list(range(len(queue)))
+        
         true_indices = deque()
         false_indices = deque()
         index = 0
         for value in queue:
-            indices.append(index)
             if value:
                 true_indices.append(index)
             else:
                 false_indices.append(index)
             index += 1
         
-        if self.is_valid_list(queue):
-            return indices
-            
         indices = []
         number_of_FIT = len(true_indices)
         step = 0
@@ -303,3 +352,33 @@ class FITSoftPriority(Priority):
     
     def is_valid_insert(self, queue: List[bool], item: bool) -> bool:
         return True
+
+
+class SpeakingTimePriority(Priority):
+    """Defines a priority that lets speakers with less speaking time so far go first."""
+
+    def __init__(self, clock: SpeakingClock) -> None:
+        """
+        Initializes the priority.
+
+        :param clock: speaking clock providing the accumulated speaking times
+        """
+        self._clock = clock
+
+    def is_valid_list(self, queue: List[str]) -> bool:
+        previous = None
+        for speaker in queue:
+            total = self._clock.total(speaker)
+            if previous is not None and total < previous:
+                return False
+            previous = total
+        return True
+
+    def sort(self, queue: List[str]) -> List[int]:
+        return sorted(range(len(queue)), key=lambda index: self._clock.total(queue[index]))
+
+    def gettype(self) -> type:
+        return type(str)
+
+    def is_valid_insert(self, queue: List[str], item: str) -> bool:
+        return True
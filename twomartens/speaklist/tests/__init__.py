@@ -15,3 +15,12 @@
 #   limitations under the License.
 
 """speaklist.tests: contains the tests for speaklist"""
+
+
+class FakeTimer:
+    """Provides a manually advanced time source."""
+    def __init__(self) -> None:
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+#   Copyright 2018 Jim Martens
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from unittest import TestCase
+
+from twomartens.speaklist.clock import IndexedHeap, RingBuffer, SpeakingClock
+from twomartens.speaklist.queue import Queue, SpeakingTimePriority, sort_data
+from twomartens.speaklist.tests import FakeTimer
+
+
+class TestRingBuffer(TestCase):
+    """Tests the RingBuffer."""
+    def test_mean(self) -> None:
+        buffer = RingBuffer(3)
+        self.assertEqual(0.0, buffer.mean())
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            buffer.append(value)
+        self.assertEqual(3, len(buffer))
+        self.assertEqual([2.0, 3.0, 4.0], list(buffer))
+        self.assertAlmostEqual(3.0, buffer.mean())
+    
+    def test_capacity(self) -> None:
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+class TestIndexedHeap(TestCase):
+    """Tests the IndexedHeap."""
+    def test_update(self) -> None:
+        heap = IndexedHeap()
+        self.assertIsNone(heap.peek())
+        heap.push('a', 3.0)
+        heap.push('b', 1.0)
+        heap.push('c', 2.0)
+        self.assertEqual('b', heap.peek())
+        heap.push('b', 5.0)
+        self.assertEqual('c', heap.peek())
+        heap.push('a', 0.5)
+        self.assertEqual('a', heap.peek())
+        self.assertEqual(5.0, heap.priority('b'))
+
+
+class TestSpeakingClock(TestCase):
+    """Tests the SpeakingClock."""
+    def setUp(self) -> None:
+        """Sets up the test case."""
+        self._timer = FakeTimer()
+        self._clock = SpeakingClock(window=2, timer=self._timer)
+    
+    def test_start_stop(self) -> None:
+        self.assertEqual(0.0, self._clock.stop())
+        self._clock.start('anyone1')
+        self.assertIsNone(self._clock.least_speaking())
+        self._timer.now = 10.0
+        self.assertEqual('anyone1', self._clock.current())
+        self.assertEqual(10.0, self._clock.elapsed())
+        self._clock.start('anyone2')
+        self._timer.now = 15.0
+        self.assertEqual(5.0, self._clock.stop())
+        self.assertIsNone(self._clock.current())
+        self.assertEqual({'anyone1': 10.0, 'anyone2': 5.0}, self._clock.totals())
+        self.assertEqual('anyone2', self._clock.least_speaking())
+        self.assertEqual([(0.0, 10.0)], self._clock.speeches('anyone1'))
+        self.assertEqual([(10.0, 15.0)], self._clock.speeches('anyone2'))
+        self.assertEqual([], self._clock.speeches('unknown'))
+        self.assertAlmostEqual(7.5, self._clock.overall_average())
+    
+    def test_average(self) -> None:
+        for duration in [1.0, 2.0, 6.0]:
+            self._clock.start('anyone')
+            self._timer.now += duration
+            self._clock.stop()
+        self.assertEqual(9.0, self._clock.total('anyone'))
+        self.assertEqual(3, self._clock.count('anyone'))
+        self.assertAlmostEqual(4.0, self._clock.average('anyone'))
+        self.assertEqual(0.0, self._clock.average('unknown'))
+    
+    def test_queue_next_speaker(self) -> None:
+        queue = Queue([], clock=self._clock)
+        queue.append(['anyone1'])
+        queue.append(['anyone2'])
+        self.assertEqual('anyone1', queue.next_speaker())
+        self.assertEqual('anyone1', self._clock.current())
+        self._timer.now = 3.0
+        queue.next_speaker()
+        self.assertEqual(3.0, self._clock.total('anyone1'))
+        self.assertEqual('anyone2', self._clock.current())
+    
+    def test_queue_clear(self) -> None:
+        queue = Queue([], clock=self._clock)
+        for speaker in ['anyone1', 'anyone2', 'anyone3']:
+            queue.append([speaker])
+        queue.next_speaker()
+        self._timer.now = 60.0
+        queue.clear()
+        self.assertEqual(0, len(queue))
+        self.assertEqual('anyone1', self._clock.current())
+        self.assertEqual(0, self._clock.count('anyone2'))
+        self._clock.stop()
+        self.assertEqual('anyone1', self._clock.least_speaking())
+        self.assertAlmostEqual(60.0, self._clock.overall_average())
+
+
+class TestSpeakingTimePriority(TestCase):
+    """Tests the SpeakingTimePriority."""
+    def setUp(self) -> None:
+        """Sets up the test case."""
+        self._timer = FakeTimer()
+        self._clock = SpeakingClock(timer=self._timer)
+        self._priority = SpeakingTimePriority(self._clock)
+        for speaker, duration in [('anyone1', 30.0), ('anyone2', 10.0)]:
+            self._clock.start(speaker)
+            self._timer.now += duration
+        self._clock.stop()
+    
+    def test_type(self) -> None:
+        self.assertEqual(type(str), self._priority.gettype())
+    
+    def test_is_valid_list(self) -> None:
+        self.assertTrue(self._priority.is_valid_list([]))
+        self.assertTrue(self._priority.is_valid_list(['alpha', 'anyone2', 'anyone1']))
+        self.assertFalse(self._priority.is_valid_list(['anyone1', 'anyone2']))
+    
+    def test_sort(self) -> None:
+        queue = ['anyone1', 'anyone2', 'alpha', 'anyone1']
+        sorted_queue = sort_data(self._priority.sort(queue), queue)
+        self.assertEqual(['alpha', 'anyone2', 'anyone1', 'anyone1'], sorted_queue)
+        self.assertTrue(self._priority.is_valid_list(sorted_queue))
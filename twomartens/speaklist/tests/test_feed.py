@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+#   Copyright 2018 Jim Martens
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import io
+import random
+from unittest import TestCase
+
+from twomartens.speaklist.feed import MOVE, FileSink, Replica, apply_change, diff_permutation, read_changes
+from twomartens.speaklist.queue import Queue, FITSoftPriority
+
+
+class TestDiffPermutation(TestCase):
+    """Tests the permutation diff."""
+    def _check(self, order) -> list:
+        changes = diff_permutation(order)
+        speakers = list(range(len(order)))
+        for change in changes:
+            self.assertEqual(MOVE, change.operation)
+            apply_change(speakers, change)
+        self.assertEqual(order, speakers)
+        return changes
+    
+    def test_identity(self) -> None:
+        self.assertEqual([], self._check([]))
+        self.assertEqual([], self._check([0, 1, 2, 3]))
+    
+    def test_minimal(self) -> None:
+        # moving the first speaker to the end is a single move
+        self.assertEqual(1, len(self._check([1, 2, 3, 0])))
+        self.assertEqual(1, len(self._check([3, 0, 1, 2])))
+        self.assertEqual(3, len(self._check([3, 2, 1, 0])))
+    
+    def test_random(self) -> None:
+        generator = random.Random(42)
+        for length in range(12):
+            for _ in range(20):
+                order = list(range(length))
+                generator.shuffle(order)
+                self._check(order)
+
+
+class TestChangeFeed(TestCase):
+    """Tests the change-feed of the Queue."""
+    def setUp(self) -> None:
+        """Sets up the test case."""
+        self._queue = Queue([FITSoftPriority()])
+        self._queue.append(['Speaker 1', False])
+        self._replica = Replica()
+        self._queue.subscribe(self._replica)
+    
+    def test_replica(self) -> None:
+        self.assertEqual(['Speaker 1'], self._replica.speakers)
+        self._queue.append(['Speaker 2', False])
+        self._queue.append(['Speaker 3', True])
+        self._queue.insert(-1, ['Speaker 4', True])
+        self._queue.insert(10, ['Speaker 5', False])
+        self.assertEqual(list(self._queue), self._replica.speakers)
+        self._queue.prioritize()
+        self.assertEqual(list(self._queue), self._replica.speakers)
+        self._queue.pop()
+        del self._queue[-1]
+        self._queue[1] = ['Speaker 6', False]
+        self.assertEqual(list(self._queue), self._replica.speakers)
+        self._queue.unsubscribe(self._replica)
+        self._queue.pop()
+        self.assertNotEqual(list(self._queue), self._replica.speakers)
+    
+    def test_file_sink(self) -> None:
+        stream = io.StringIO()
+        self._queue.subscribe(FileSink(stream))
+        self._queue.append(['Speaker 2', False])
+        self._queue.append(['Speaker 3', True])
+        self._queue.prioritize()
+        stream.seek(0)
+        replica = Replica()
+        for change in read_changes(stream):
+            replica(change)
+        self.assertEqual(list(self._queue), replica.speakers)
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+#   Copyright 2018 Jim Martens
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import atexit
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Union
+from unittest import TestCase
+
+from hypothesis import given, settings, strategies
+from hypothesis.strategies import DataObject
+from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, precondition, rule
+
+from twomartens.speaklist.clock import SpeakingClock
+from twomartens.speaklist.feed import Replica
+from twomartens.speaklist.queue import Queue, FirstSpeakerPriority, FITSoftPriority, SpeakingTimePriority
+from twomartens.speaklist.reference import ReferenceQueue, ReferenceFirstSpeakerPriority, ReferenceFITSoftPriority
+from twomartens.speaklist.tests import FakeTimer
+
+# if set, the benchmark timings are written as JSON to this path
+TIMINGS_PATH = os.environ.get('SPEAKLIST_TIMINGS')
+BENCHMARK_SIZE = 2000
+BENCHMARK_REPEATS = 5
+
+names = strategies.sampled_from(['anyone1', 'anyone2', 'anyone3', 'alpha', 'beta'])
+priority_kinds = strategies.sampled_from(['first_speaker', 'fit_soft', 'speaking_time'])
+
+
+class Timings:
+    """Accumulates the time spent in the optimized and the reference implementation on the benchmark."""
+    def __init__(self) -> None:
+        self._seconds = defaultdict(float)  # type: Dict[str, float]
+    
+    def measure(self, name: str, function: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = function()
+        self._seconds[name] += time.perf_counter() - start
+        return result
+    
+    def write(self) -> None:
+        with open(TIMINGS_PATH, 'w') as file:
+            json.dump(dict(self._seconds), file, indent=2, sort_keys=True)
+
+
+TIMINGS = Timings()
+if TIMINGS_PATH is not None:
+    atexit.register(TIMINGS.write)
+
+
+def create_queue(queue_class: type, kinds: List[str], clock: SpeakingClock) -> Union[Queue, ReferenceQueue]:
+    """Creates a queue with the optimized or the reference priorities for given kinds."""
+    reference = queue_class is ReferenceQueue
+    priorities = []
+    for kind in kinds:
+        if kind == 'first_speaker':
+            priorities.append(ReferenceFirstSpeakerPriority() if reference else FirstSpeakerPriority())
+        elif kind == 'fit_soft':
+            priorities.append(ReferenceFITSoftPriority() if reference else FITSoftPriority())
+        else:
+            priorities.append(SpeakingTimePriority(clock))
+    if reference:
+        return ReferenceQueue(priorities)
+    return Queue(priorities, clock=clock)
+
+
+def create_value(kinds: List[str], name: str, fit: bool) -> list:
+    """Creates the list of name and priority data for given kinds."""
+    value = [name]
+    for kind in kinds:
+        value.append(fit if kind == 'fit_soft' else name)
+    return value
+
+
+class TestPriorities(TestCase):
+    """Compares the optimized priorities with the reference priorities."""
+    @given(strategies.lists(names, max_size=12))
+    def test_first_speaker_is_valid_list(self, queue: List[str]) -> None:
+        self.assertEqual(ReferenceFirstSpeakerPriority().is_valid_list(queue),
+                         FirstSpeakerPriority().is_valid_list(queue))
+    
+    @given(strategies.lists(strategies.booleans(), max_size=12))
+    def test_fit_soft_is_valid_list(self, queue: List[bool]) -> None:
+        self.assertEqual(ReferenceFITSoftPriority().is_valid_list(queue), FITSoftPriority().is_valid_list(queue))
+    
+    @given(strategies.lists(strategies.booleans(), max_size=12))
+    def test_fit_soft_sort(self, queue: List[bool]) -> None:
+        self.assertEqual(ReferenceFITSoftPriority().sort(queue), FITSoftPriority().sort(queue))
+
+
+class QueueComparison(RuleBasedStateMachine):
+    """Runs random operation sequences against the optimized and the reference queue."""
+    def __init__(self) -> None:
+        super().__init__()
+        self._timer = FakeTimer()
+        self._kinds = []  # type: List[str]
+        self._queue = None  # type: Queue
+        self._reference = None  # type: ReferenceQueue
+        self._reference_clock = None  # type: SpeakingClock
+        self._replica = Replica()
+    
+    def _run(self, operation: str, function: Callable[[Union[Queue, ReferenceQueue]], Any]) -> None:
+        expected = function(self._reference)
+        actual = function(self._queue)
+        assert expected == actual, (operation, expected, actual)
+    
+    @initialize(kinds=strategies.lists(priority_kinds, min_size=1, max_size=3))
+    def create_queues(self, kinds: List[str]) -> None:
+        self._kinds = kinds
+        self._queue = create_queue(Queue, kinds, SpeakingClock(timer=self._timer))
+        self._queue.subscribe(self._replica)
+        # the reference queue has no clock of its own, the machine starts this one for it
+        self._reference_clock = SpeakingClock(timer=self._timer)
+        self._reference = create_queue(ReferenceQueue, kinds, self._reference_clock)
+    
+    @rule(name=names, fit=strategies.booleans())
+    def append(self, name: str, fit: bool) -> None:
+        self._run('append', lambda queue: queue.append(create_value(self._kinds, name, fit)))
+    
+    @rule(index=strategies.integers(-6, 6), name=names, fit=strategies.booleans())
+    def insert(self, index: int, name: str, fit: bool) -> None:
+        self._run('insert', lambda queue: queue.insert(index, create_value(self._kinds, name, fit)))
+    
+    @precondition(lambda self: self._queue is not None and len(self._queue) > 0)
+    @rule(data=strategies.data(), name=names, fit=strategies.booleans())
+    def replace(self, data: DataObject, name: str, fit: bool) -> None:
+        index = data.draw(strategies.integers(-len(self._queue), len(self._queue) - 1))
+        self._run('__setitem__', lambda queue: queue.__setitem__(index, create_value(self._kinds, name, fit)))
+    
+    @precondition(lambda self: self._queue is not None and len(self._queue) > 0)
+    @rule()
+    def pop(self) -> None:
+        self._run('pop', lambda queue: queue.pop())
+    
+    @precondition(lambda self: self._queue is not None and len(self._queue) > 0)
+    @rule(duration=strategies.floats(0.0, 300.0))
+    def next_speaker(self, duration: float) -> None:
+        self._timer.now += duration
+        expected = self._reference.pop()
+        self._reference_clock.start(expected)
+        actual = self._queue.next_speaker()
+        assert expected == actual, ('next_speaker', expected, actual)
+    
+    @precondition(lambda self: self._queue is not None and len(self._queue) > 0)
+    @rule(data=strategies.data())
+    def delete(self, data: DataObject) -> None:
+        index = data.draw(strategies.integers(-len(self._queue), len(self._queue) - 1))
+        self._run('delete', lambda queue: queue.__delitem__(index))
+    
+    # FirstSpeakerPriority does not implement sort yet
+    @precondition(lambda self: 'first_speaker' not in self._kinds)
+    @rule()
+    def prioritize(self) -> None:
+        self._run('prioritize', lambda queue: queue.prioritize())
+    
+    @invariant()
+    def same_state(self) -> None:
+        if self._queue is None:
+            return
+        self._run('is_prioritized', lambda queue: queue.is_prioritized())
+        self._run('_get_priority_data', lambda queue: list(queue._get_priority_data().values()))
+        assert list(self._queue) == list(self._reference)
+        assert self._replica.speakers == list(self._queue)
+
+
+TestQueueComparison = QueueComparison.TestCase
+TestQueueComparison.settings = settings(max_examples=200, stateful_step_count=30, deadline=None)
+
+
+class TestBenchmark(TestCase):
+    """Times the optimized and the reference implementation on seeded lists of realistic size."""
+    def setUp(self) -> None:
+        """Sets up the test case."""
+        generator = random.Random(2018)
+        speakers = ['speaker {}'.format(number) for number in range(BENCHMARK_SIZE // 10)]
+        # everyone speaks once before anyone speaks again, so the whole list has to be checked
+        self._names = []  # type: List[str]
+        while len(self._names) < BENCHMARK_SIZE:
+            generator.shuffle(speakers)
+            self._names.extend(speakers)
+        self._fits = [generator.random() < 0.3 for _ in range(BENCHMARK_SIZE)]
+    
+    def _compare(self, operation: str, reference: Callable[[], Any], optimized: Callable[[], Any]) -> None:
+        for _ in range(BENCHMARK_REPEATS):
+            expected = TIMINGS.measure('reference.' + operation, reference)
+            actual = TIMINGS.measure('optimized.' + operation, optimized)
+            self.assertEqual(expected, actual)
+    
+    def test_priorities(self) -> None:
+        self._compare('first_speaker.is_valid_list',
+                      lambda: ReferenceFirstSpeakerPriority().is_valid_list(self._names),
+                      lambda: FirstSpeakerPriority().is_valid_list(self._names))
+        self._compare('fit_soft.is_valid_list',
+                      lambda: ReferenceFITSoftPriority().is_valid_list(self._fits),
+                      lambda: FITSoftPriority().is_valid_list(self._fits))
+        self._compare('fit_soft.sort',
+                      lambda: ReferenceFITSoftPriority().sort(self._fits),
+                      lambda: FITSoftPriority().sort(self._fits))
+    
+    def test_queue(self) -> None:
+        kinds = ['fit_soft', 'speaking_time']
+        timer = FakeTimer()
+        queue = create_queue(Queue, kinds, SpeakingClock(timer=timer))
+        reference = create_queue(ReferenceQueue, kinds, SpeakingClock(timer=timer))
+        values = [create_value(kinds, name, fit) for name, fit in zip(self._names, self._fits)]
+        
+        TIMINGS.measure('reference.queue.append', lambda: [reference.append(value) for value in values])
+        TIMINGS.measure('optimized.queue.append', lambda: [queue.append(value) for value in values])
+        self._compare('queue.is_prioritized', reference.is_prioritized, queue.is_prioritized)
+        self._compare('queue._get_priority_data',
+                      lambda: list(reference._get_priority_data().values()),
+                      lambda: list(queue._get_priority_data().values()))
+        self._compare('queue.prioritize', reference.prioritize, queue.prioritize)
+        self.assertEqual(list(reference), list(queue))